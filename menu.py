@@ -1,9 +1,147 @@
 from __future__ import annotations
-from colorama import Fore as Color, init
+from collections import OrderedDict
 from typing import Callable
-from os import system
+import io
+import shutil
+import sys
 
-init()
+
+class _LazyColor:
+    """
+    Stand-in for colorama's Fore until colorama has been imported and initialized.
+    Any attribute access loads colorama and forwards to the real Fore.
+    """
+
+    def __getattr__(self, name: str):
+        _ensure_colorama()
+        return getattr(Color, name)
+
+
+Color = _LazyColor()
+_colorama_ready = False
+
+# Marks a color argument that was not given, so the default can be resolved lazily.
+_DEFAULT = object()
+
+
+def _ensure_colorama():
+    """
+    Import and initialize colorama on first use instead of at module import.
+    """
+    global Color, _colorama_ready
+    if not _colorama_ready:
+        from colorama import Fore, init
+        init()
+        Color = Fore
+        _colorama_ready = True
+
+
+def _default_color(color, name: str):
+    """
+    Resolve a color argument, falling back to a colorama color when it was not given.
+
+    :param color: The color passed by the caller, or _DEFAULT.
+    :param name: The name of the default color in colorama's Fore.
+    :return: The color code to use.
+    """
+    return getattr(Color, name) if color is _DEFAULT else color
+
+
+# Maximum number of rendered collapsed-mode levels kept per menu.
+FRAME_CACHE_SIZE = 8
+
+# Entry kinds returned by the _ENTRY_HANDLERS used by Menu.__compile__. The first
+# three are also the KIND attribute of MenuSeparator, MenuFolder and MenuOption.
+KIND_SEPARATOR = 0
+KIND_FOLDER = 1
+KIND_OPTION = 2
+KIND_EMPTY_FOLDER = 3
+
+# ANSI "erase screen" + "cursor home"; colorama translates it on legacy Windows consoles.
+CLEAR_SCREEN = b"\x1b[2J\x1b[H"
+
+
+def _console_encoding() -> str:
+    """
+    :return: The encoding used for text written to the console.
+    """
+    return getattr(sys.stdout, "encoding", None) or "utf-8"
+
+
+def _write(data: bytes):
+    """
+    Write encoded output to the console in a single call and flush it.
+
+    Plain text streams get the bytes on their binary buffer, skipping the encode step.
+    Wrapped streams (e.g. colorama's converter on Windows) must see the text, so they
+    get it decoded.
+
+    :param data: The output, encoded with _console_encoding().
+    """
+    stream = sys.stdout
+    if isinstance(stream, io.TextIOWrapper):
+        stream.flush()
+        stream.buffer.write(data)
+        stream.buffer.flush()
+    else:
+        stream.write(data.decode(_console_encoding(), "replace"))
+        stream.flush()
+
+
+def _read_line() -> str:
+    """
+    Read one line of user input directly from stdin; unlike input(), no prompt is
+    written (it is sent as part of the frame).
+
+    :return: The line without its line break.
+    :raises EOFError: If stdin is exhausted, as input() would.
+    """
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
+def _style(text: str, color: str, active: list) -> str:
+    """
+    Color a span of text, emitting the color code only when it changes.
+
+    :param text: The text of the span.
+    :param color: The color for the span.
+    :param active: One-element list holding the color currently active on the line.
+    :return: The text, prefixed with the color code if it differs from the active one.
+    """
+    if active[0] == color:
+        return text
+    active[0] = color
+    return f"{color}{text}"
+
+
+def _separator_entry(item):
+    """
+    :return: The (kind, label, children) entry for a separator.
+    """
+    return KIND_SEPARATOR, item._styled, None
+
+
+def _folder_entry(item):
+    """
+    :return: The (kind, label, children) entry for a folder; children is None if it is empty.
+    """
+    if item.children:
+        return KIND_FOLDER, item._styled_named, item.children
+    return KIND_EMPTY_FOLDER, item._styled_empty, None
+
+
+def _option_entry(item):
+    """
+    :return: The (kind, label, children) entry for an option.
+    """
+    return KIND_OPTION, item._styled, None
+
+
+# Entry builders indexed by an item's KIND, used instead of isinstance() chains.
+_ENTRY_HANDLERS = (_separator_entry, _folder_entry, _option_entry)
 
 
 class Menu:
@@ -14,38 +152,112 @@ class Menu:
       - Collapsed: step-by-step navigation (folders open on demand).
     """
 
-    def __init__(self, label: str, label_color=Color.LIGHTRED_EX,
-                 option_color=Color.LIGHTMAGENTA_EX, aux_color=Color.CYAN,
-                 include_exit: bool = True):
+    def __init__(self, label: str, label_color=_DEFAULT,
+                 option_color=_DEFAULT, aux_color=_DEFAULT,
+                 include_exit: bool = True, async_actions: bool = False):
         """
         Initialize the Menu.
 
         :param label: The menu title.
-        :param label_color: The color for the title.
-        :param option_color: The color for options.
-        :param aux_color: The auxiliary color (used for numbering, extra text, etc.).
+        :param label_color: The color for the title (defaults to Color.LIGHTRED_EX).
+        :param option_color: The color for options (defaults to Color.LIGHTMAGENTA_EX).
+        :param aux_color: The auxiliary color (used for numbering, extra text, etc.;
+                          defaults to Color.CYAN).
         :param include_exit: If True, automatically add an "exit" option.
+        :param async_actions: If True, selected actions run on a background worker thread
+                              and show() returns without waiting for them. Actions must
+                              then be safe to run off the main thread: no input(), no
+                              shared state without locking, and no exit() (the
+                              built-in "exit" option still runs on the main thread).
+                              The worker is a daemon thread: when the program exits,
+                              e.g. through the "exit" option, an action still running
+                              is abandoned and queued ones never start.
         """
+        _ensure_colorama()
+        label_color = _default_color(label_color, "LIGHTRED_EX")
+        option_color = _default_color(option_color, "LIGHTMAGENTA_EX")
+        aux_color = _default_color(aux_color, "CYAN")
         self.__items__ = []
+        # Root-level items by name, so lookups do not scan the item list.
+        self.__index__ = {}
+        # Bumped on every structural change; rendered frames are cached per revision.
+        self.__revision__ = 0
+        self.__frame_cache__: OrderedDict[tuple, tuple] = OrderedDict()
+        # Flattened tree for the expanded renderer and its number -> option map,
+        # see __compile__.
+        self.__compiled__: tuple | None = None
+        self.__selectable__: dict[str, MenuOption] = {}
+        # Pre-rendered expanded frame and the revision it was built for, see finalize().
+        self.__frame__ = b""
+        self.__finalized__: int | None = None
+        # (revision, items) shown at the root level in collapsed mode.
+        self.__root_view_cache__: tuple[int, list] | None = None
+        # Lines currently on screen in collapsed mode; None when the screen state is unknown.
+        self.__last_frame_lines__: list[bytes] | None = None
         self.set_label(label, label_color)
         self.label_color = label_color
-        self.option_color = option_color
-        self.aux_color = aux_color
-        self.__include_exit__ = include_exit
-        self.__exit_included__ = False
+        self.__option_color__ = option_color
+        self.__aux_color__ = aux_color
+        self.__exit_option__: MenuOption | None = None
+        self.__async_actions__ = async_actions
+        # Queue feeding the single daemon worker for background actions; created on first use.
+        self.__action_queue__ = None
+        # The exit option is created up front; root items added later go before it.
+        if include_exit:
+            self.__exit_option__ = self.add_option("exit", exit)
+
+    @property
+    def option_color(self):
+        """
+        The color for options and folder names. Setting it re-colors existing items.
+        """
+        return self.__option_color__
+
+    @option_color.setter
+    def option_color(self, color):
+        self.__option_color__ = color
+        self.__restyle()
 
-    def set_label(self, label: str, color=Color.RED) -> str:
+    @property
+    def aux_color(self):
+        """
+        The auxiliary color (numbering, separators, extra text). Setting it re-colors
+        existing items.
+        """
+        return self.__aux_color__
+
+    @aux_color.setter
+    def aux_color(self, color):
+        self.__aux_color__ = color
+        self.__restyle()
+
+    def __restyle(self):
+        """
+        Private method re-rendering the labels of every item with the current colors
+        and invalidating the cached frames.
+        """
+        stack = list(self.__items__)
+        while stack:
+            item = stack.pop()
+            item._apply_colors(self.__option_color__, self.__aux_color__)
+            if item.KIND == KIND_FOLDER:
+                stack.extend(item.children)
+        self.__revision__ += 1
+
+    def set_label(self, label: str, color=_DEFAULT) -> str:
         """
         Set the menu title with optional color formatting.
 
         :param label: The menu title.
-        :param color: Color code for the title.
+        :param color: Color code for the title (defaults to Color.RED; None for no color).
         :return: The formatted title.
         """
+        color = _default_color(color, "RED")
         if color is not None:
             self.__label__ = f"{color}=== {label} ==={Color.RESET}"
         else:
             self.__label__ = label
+        self.__revision__ += 1
         return self.__label__
 
     def add_option(self, name: str, action: Callable[[], None],
@@ -58,11 +270,13 @@ class Menu:
         :param parent: Optional parent folder; if None, the option is added at root.
         :return: The created MenuOption instance.
         """
-        option = MenuOption(name, action, parent)
+        option = MenuOption(name, action, parent, self.option_color)
         if parent is None:
-            self.__items__.append(option)
+            self.__append_root(option)
+            self.__index__.setdefault(name, option)
         else:
             parent.add_child(option)
+        self.__revision__ += 1
         return option
 
     def set_folder(self, name: str, parent: MenuFolder = None) -> MenuFolder:
@@ -73,11 +287,14 @@ class Menu:
         :param parent: Optional parent folder; if None, the folder is added at root.
         :return: The created MenuFolder instance.
         """
-        folder = MenuFolder(name, parent)
+        folder = MenuFolder(name, parent, self.option_color, self.aux_color)
+        folder._menu = self
         if parent is None:
-            self.__items__.append(folder)
+            self.__append_root(folder)
+            self.__index__.setdefault(name, folder)
         else:
             parent.add_child(folder)
+        self.__revision__ += 1
         return folder
 
     def add_separator(self, parent: MenuFolder = None) -> MenuSeparator:
@@ -87,13 +304,30 @@ class Menu:
         :param parent: Optional parent folder; if None, the separator is added at root.
         :return: The created MenuSeparator instance.
         """
-        separator = MenuSeparator()
+        separator = MenuSeparator(self.aux_color)
         if parent is None:
-            self.__items__.append(separator)
+            self.__append_root(separator)
         else:
             parent.add_child(separator)
+        self.__revision__ += 1
         return separator
 
+    def __append_root(self, item):
+        """
+        Private method adding an item at the root level, keeping the exit option last.
+
+        :param item: The item to add.
+        """
+        exit_option = self.__exit_option__
+        if exit_option is None:
+            self.__items__.append(item)
+        else:
+            self.__items__.insert(len(self.__items__) - 1, item)
+            # The item now comes before the exit option, so it takes over a shared name.
+            name = getattr(item, 'name', None)
+            if name is not None and self.__index__.get(name) is exit_option:
+                self.__index__[name] = item
+
     def get_item(self, name: str):
         """
         Retrieve a menu item by name (if the item has a 'name' attribute).
@@ -101,10 +335,7 @@ class Menu:
         :param name: The name of the item.
         :return: The menu item if found; otherwise, None.
         """
-        for item in self.__items__:
-            if hasattr(item, 'name') and item.name == name:
-                return item
-        return None
+        return self.__index__.get(name)
 
     def remove_item(self, name: str):
         """
@@ -112,15 +343,47 @@ class Menu:
 
         :param name: The name of the item to remove.
         """
-        item = self.get_item(name)
+        item = self.__index__.pop(name, None)
         if item is not None:
             self.__items__.remove(item)
+            if item is self.__exit_option__:
+                self.__exit_option__ = None
+            # Another root item may share the name; it becomes the one found by get_item.
+            for other in self.__items__:
+                if getattr(other, 'name', None) == name:
+                    self.__index__[name] = other
+                    break
+            self.__revision__ += 1
+
+    def __cached_frame(self, key: tuple):
+        """
+        Look up a previously rendered frame.
+
+        :param key: The cache key; its first element must be the menu revision.
+        :return: A (frame, selectable) tuple, or None if the frame is not cached.
+        """
+        entry = self.__frame_cache__.get(key)
+        if entry is not None:
+            self.__frame_cache__.move_to_end(key)
+        return entry
+
+    def __store_frame(self, key: tuple, frame, selectable):
+        """
+        Cache a rendered frame, evicting the least recently used one when full.
+
+        :param key: The cache key; its first element must be the menu revision.
+        :param frame: The encoded lines of the frame.
+        :param selectable: The items of the frame, indexed by number - 1.
+        """
+        self.__frame_cache__[key] = (frame, selectable)
+        if len(self.__frame_cache__) > FRAME_CACHE_SIZE:
+            self.__frame_cache__.popitem(last=False)
 
     def __clear_console__(self):
         """
         Clear the console screen.
         """
-        system('cls')
+        _write(CLEAR_SCREEN)
 
     def show(self, clear_console: bool = True, collapsed: bool = False):
         """
@@ -131,60 +394,157 @@ class Menu:
 
         :param clear_console: If True, clears the console before displaying.
         :param collapsed: If True, use collapsed (step-by-step) mode.
+        :return: With async_actions, the Future of the started action; otherwise None.
         """
-        # Automatically add the exit option only once if requested.
-        if self.__include_exit__ and not self.__exit_included__:
-            self.add_option("exit", exit)
-            self.__exit_included__ = True
-
-        if clear_console:
-            self.__clear_console__()
-        print(self.__label__)
-
         if collapsed:
+            # Collapsed mode clears the console itself before the first frame.
+            self.__last_frame_lines__ = None
             selected_option = self.__show_collapsed(self.__items__, path=[])
             if selected_option is not None and selected_option != "back":
-                self.__clear_console__()
-                selected_option.invoke()
+                return self.__invoke(selected_option)
             else:
                 print(f"{Color.RED}No available options or menu closed.{Color.RESET}")
         else:
             # Expanded mode: display the full menu tree with composite numbering.
-            selectable = {}
-
-            def recursive_print(items, parent_number="", depth=0):
-                indent = "   " * depth
-                counter = 0
-                for item in items:
-                    if isinstance(item, MenuSeparator):
-                        print(f"{indent}{self.aux_color}- - -{Color.RESET}")
-                    elif isinstance(item, MenuFolder):
-                        if item.children:
-                            counter += 1
-                            number = (f"{parent_number}{counter}" if parent_number == ""
-                                      else f"{parent_number}.{counter}")
-                            print(f"{indent}{self.aux_color}{number}. "
-                                  f"{self.option_color}[{item.name}]{Color.RESET}")
-                            recursive_print(item.children, number, depth + 1)
-                        else:
-                            print(f"{indent}{self.option_color}[{item.name}]{Color.RESET} "
-                                  f"{self.aux_color}<empty>{Color.RESET}")
-                    elif isinstance(item, MenuOption):
-                        counter += 1
-                        number = (f"{parent_number}{counter}" if parent_number == ""
-                                  else f"{parent_number}.{counter}")
-                        print(f"{indent}{self.aux_color}{number}. "
-                              f"{self.option_color}{item.name}{Color.RESET}")
-                        selectable[number] = item
-
-            recursive_print(self.__items__, "", 0)
+            # The frame is pre-rendered; the clear is sent in the same write.
+            self.finalize()
+            _write(CLEAR_SCREEN + self.__frame__ if clear_console else self.__frame__)
             selection = input(f"\n{self.aux_color}Select an option: {Color.RESET}")
-            if selection in selectable:
-                chosen_option = selectable[selection]
-                self.__clear_console__()
-                chosen_option.invoke()
+            chosen_option = self.__selectable__.get(selection)
+            if chosen_option is not None:
+                return self.__invoke(chosen_option)
             else:
                 print(f"{Color.RED}Invalid selection!{Color.RESET}")
+        return None
+
+    def finalize(self):
+        """
+        Pre-render the expanded menu, so show() only has to write it out and look up
+        the selection. show() does this by itself whenever the menu changed; calling
+        it once a static menu is built moves that work to start-up.
+        """
+        if self.__finalized__ != self.__revision__:
+            self.__frame__ = self.__render_expanded()
+            self.__finalized__ = self.__revision__
+
+    def __invoke(self, option: MenuOption):
+        """
+        Private method clearing the console and running the selected option's action,
+        on the background worker if async_actions is enabled.
+
+        :param option: The selected option.
+        :return: The Future of the action when it runs in the background; otherwise None.
+        """
+        self.__clear_console__()
+        if not self.__async_actions__ or option is self.__exit_option__:
+            option.invoke()
+            return None
+        from concurrent.futures import Future
+        if self.__action_queue__ is None:
+            from queue import SimpleQueue
+            from threading import Thread
+            self.__action_queue__ = SimpleQueue()
+            Thread(target=self.__run_actions, args=(self.__action_queue__,),
+                   name="menu-action", daemon=True).start()
+        future = Future()
+        self.__action_queue__.put((option, future))
+        return future
+
+    @staticmethod
+    def __run_actions(actions):
+        """
+        Private method run by the background worker: invokes queued options in order and
+        reports each outcome through its Future.
+
+        :param actions: Queue of (MenuOption, Future) pairs.
+        """
+        while True:
+            option, future = actions.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(option.invoke())
+            except BaseException as error:
+                future.set_exception(error)
+
+    def __compile__(self):
+        """
+        Flatten the menu tree into parallel arrays for the expanded renderer.
+        The arrays are rebuilt only when the menu revision has changed.
+
+        Composite numbers are assigned to the items (``item.__number__``) and
+        collected in ``self.__selectable__`` at the same time.
+
+        :return: A (revision, indents, numbers, labels) tuple. For entry i, indents[i],
+                 numbers[i] and labels[i] are the pieces of its line, encoded for
+                 the console.
+        """
+        compiled = self.__compiled__
+        if compiled is not None and compiled[0] == self.__revision__:
+            return compiled
+
+        indents, numbers, labels = [], [], []
+        selectable = {}
+        aux_color = self.aux_color
+        encoding = _console_encoding()
+
+        # Pre-order walk with an explicit stack: one iterator, number prefix and
+        # counter per open folder level. Indents are built once per depth.
+        depth_indents = [b""]
+        stack = [iter(self.__items__)]
+        prefixes = [""]
+        counters = [0]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                prefixes.pop()
+                counters.pop()
+                continue
+            depth = len(stack) - 1
+            if depth == len(depth_indents):
+                depth_indents.append(depth_indents[-1] + b"   ")
+
+            kind, label, children = _ENTRY_HANDLERS[item.KIND](item)
+            if kind == KIND_OPTION or kind == KIND_FOLDER:
+                counters[-1] += 1
+                number = prefixes[-1] + str(counters[-1])
+                item.__number__ = number
+                numbers.append(f"{aux_color}{number}. ".encode(encoding))
+                if kind == KIND_OPTION:
+                    selectable[number] = item
+            else:
+                if kind == KIND_EMPTY_FOLDER:
+                    item.__number__ = None
+                numbers.append(b"")
+
+            indents.append(depth_indents[depth])
+            labels.append(label.encode(encoding, "replace"))
+            if children:
+                stack.append(iter(children))
+                prefixes.append(number + ".")
+                counters.append(0)
+
+        self.__selectable__ = selectable
+        self.__compiled__ = (self.__revision__, indents, numbers, labels)
+        return self.__compiled__
+
+    def __render_expanded(self):
+        """
+        Private method rendering the full menu tree with composite numbering.
+
+        :return: The encoded frame.
+        """
+        _, indents, numbers, labels = self.__compile__()
+        # Labels leave their color active; a single reset closes every line.
+        reset = f"{Color.RESET}\n".encode("ascii")
+        frame = bytearray(f"{self.__label__}\n".encode(_console_encoding(), "replace"))
+        for indent, number, label in zip(indents, numbers, labels):
+            frame += indent
+            frame += number
+            frame += label
+            frame += reset
+        return bytes(frame)
 
     def __show_collapsed(self, items, path):
         """
@@ -194,71 +554,63 @@ class Menu:
         :param path: List of selected folders from the root to the current level.
         :return: The selected MenuOption, or "back" if the user chooses to go back.
         """
+        encoding = _console_encoding()
+        prompt = f"{self.aux_color}Select an option: {Color.RESET}".encode(encoding)
+        # Error for the previous input, shown on the blank line above the prompt.
+        message = None
         while True:
-            self.__clear_console__()
-            current_path = " / ".join(folder.name for folder in path) if path else "ROOT"
-            print(f"{self.__label__} (Current path: {current_path})\n")
-
             # At root level, if folders exist, we normally show only folders.
             # However, we always want to include the exit option.
             if not path:
-                folders = [item for item in items if isinstance(item, MenuFolder)]
-                exit_options = [item for item in items
-                                if isinstance(item, MenuOption) and item.name.lower() == "exit"]
-                current_items = folders + exit_options if folders else items
+                view = self.__root_view_cache__
+                if view is None or view[0] != self.__revision__:
+                    folders = [item for item in items if item.KIND == KIND_FOLDER]
+                    exit_options = [item for item in items
+                                    if item.KIND == KIND_OPTION and item.name.lower() == "exit"]
+                    view = (self.__revision__, folders + exit_options if folders else items)
+                    self.__root_view_cache__ = view
+                current_items = view[1]
             else:
                 current_items = items
 
             if not current_items:
-                print(f"{self.aux_color}<empty>{Color.RESET}")
-                input(f"\n{self.aux_color}Press Enter to go back...{Color.RESET}")
+                current_path = " / ".join(folder.name for folder in path) if path else "ROOT"
+                lines = [f"{self.__label__} (Current path: {current_path})", "",
+                         f"{self.aux_color}<empty>{Color.RESET}", ""]
+                self.__draw_lines([line.encode(encoding, "replace") for line in lines],
+                                  f"{self.aux_color}Press Enter to go back...{Color.RESET}"
+                                  .encode(encoding))
+                self.__read_input(len("Press Enter to go back..."))
                 return "back"
 
-            # In nested levels, display "0. Back" at the beginning.
-            if path:
-                print(f"{self.aux_color}0. Back{Color.RESET}")
-
-            mapping = {}
-            num = 1
-            for item in current_items:
-                if isinstance(item, MenuSeparator):
-                    print(f"{self.aux_color}- - -{Color.RESET}")
-                else:
-                    if isinstance(item, MenuFolder):
-                        if not item.children:
-                            print(f"{self.aux_color}{num}. "
-                                  f"{self.option_color}[{item.name}]{Color.RESET} "
-                                  f"{self.aux_color}<empty>{Color.RESET}")
-                        else:
-                            print(f"{self.aux_color}{num}. "
-                                  f"{self.option_color}[{item.name}]{Color.RESET}")
-                    elif isinstance(item, MenuOption):
-                        print(f"{self.aux_color}{num}. "
-                              f"{self.option_color}{item.name}{Color.RESET}")
-                    mapping[num] = item
-                    num += 1
-
-            selection = input(f"\n{self.aux_color}Select an option: {Color.RESET}")
+            key = (self.__revision__, tuple(id(folder) for folder in path))
+            cached = self.__cached_frame(key)
+            if cached is not None:
+                lines, mapping = cached
+            else:
+                lines, mapping = self.__render_collapsed(current_items, path)
+                self.__store_frame(key, lines, mapping)
+            if message is not None:
+                lines = lines[:-1] + [message]
+                message = None
+            self.__draw_lines(lines, prompt)
+            selection = self.__read_input(len("Select an option: ")).strip()
             if path and selection == "0":
                 return "back"
 
-            try:
-                choice = int(selection)
-            except ValueError:
-                print(f"{Color.RED}Invalid selection!{Color.RESET}")
-                input("Press Enter to continue...")
-                continue
-
-            if choice not in mapping:
-                print(f"{Color.RED}Invalid selection!{Color.RESET}")
-                input("Press Enter to continue...")
+            # Numbers are dense (1..N), so a plain list lookup replaces int()/try/except.
+            # Input longer than the largest number cannot be valid; it is rejected before
+            # int(), which refuses very long digit strings.
+            choice = (int(selection) if selection.isdecimal()
+                      and len(selection) <= len(str(len(mapping))) else 0)
+            if not 0 < choice <= len(mapping):
+                message = f"{Color.RED}Invalid selection!{Color.RESET}".encode(encoding)
                 continue
 
-            selected_item = mapping[choice]
-            if isinstance(selected_item, MenuFolder):
+            selected_item = mapping[choice - 1]
+            if selected_item.KIND == KIND_FOLDER:
                 if not selected_item.children:
-                    print(f"{Color.RED}Folder is empty!{Color.RESET}")
-                    input("Press Enter to continue...")
+                    message = f"{Color.RED}Folder is empty!{Color.RESET}".encode(encoding)
                     continue
                 else:
                     result = self.__show_collapsed(selected_item.children, path + [selected_item])
@@ -266,26 +618,136 @@ class Menu:
                         continue
                     elif result is not None:
                         return result
-            elif isinstance(selected_item, MenuOption):
+            elif selected_item.KIND == KIND_OPTION:
                 return selected_item
 
+    def __draw_lines(self, lines: list[bytes], prompt: bytes):
+        """
+        Private method drawing a collapsed-mode frame, rewriting only the lines that
+        changed since the previous frame. The prompt is (re)written below the frame;
+        anything below that (old prompt, typed input) is erased first.
+
+        :param lines: The encoded lines of the frame, without line breaks.
+        :param prompt: The encoded input prompt.
+        """
+        last = self.__last_frame_lines__
+        # Rows are addressed absolutely, which only holds on a terminal (colorama strips
+        # the cursor moves from redirected output), while every line fits on one row
+        # and the frame plus prompt fit on the screen; otherwise repaint everything, and
+        # do not diff the next frame against this one either. A line's byte length is
+        # never below its visible width, so it is a safe bound for wrapping.
+        fits = sys.stdout.isatty()
+        if fits:
+            size = shutil.get_terminal_size()
+            fits = (len(lines) + 1 < size.lines
+                    and all(len(line) < size.columns for line in lines))
+        if last is None or not fits:
+            frame = bytearray(CLEAR_SCREEN)
+            for line in lines:
+                frame += line
+                frame += b"\n"
+        else:
+            frame = bytearray()
+            for row, line in enumerate(lines):
+                if row >= len(last) or last[row] != line:
+                    frame += b"\x1b[%d;1H\x1b[2K" % (row + 1)
+                    frame += line
+            frame += b"\x1b[%d;1H\x1b[J" % (len(lines) + 1)
+        frame += prompt
+        self.__last_frame_lines__ = lines if fits else None
+        _write(bytes(frame))
+
+    def __read_input(self, prompt_width: int) -> str:
+        """
+        Private method reading a line typed after a collapsed-mode prompt. Input that
+        wraps past the end of the prompt line scrolls the frame, so the next frame is
+        then drawn from a cleared screen instead of being diffed.
+
+        :param prompt_width: The visible width of the prompt, in columns.
+        :return: The line read, without the trailing newline.
+        """
+        line = _read_line()
+        if prompt_width + len(line) >= shutil.get_terminal_size().columns:
+            self.__last_frame_lines__ = None
+        return line
+
+    def __render_collapsed(self, current_items, path):
+        """
+        Private method rendering a single level of the menu in collapsed mode.
+
+        :param current_items: List of menu items to display at this level.
+        :param path: List of selected folders from the root to the current level.
+        :return: A (lines, mapping) tuple, where lines are encoded for the console and
+                 mapping[number - 1] is the item displayed with that number.
+        """
+        current_path = " / ".join(folder.name for folder in path) if path else "ROOT"
+        lines = [f"{self.__label__} (Current path: {current_path})", ""]
+
+        # In nested levels, display "0. Back" at the beginning.
+        if path:
+            lines.append(f"{self.aux_color}0. Back{Color.RESET}")
+
+        mapping = []
+        num = 1
+        for item in current_items:
+            kind, label, _ = _ENTRY_HANDLERS[item.KIND](item)
+            if kind == KIND_SEPARATOR:
+                lines.append(f"{label}{Color.RESET}")
+            else:
+                lines.append(f"{self.aux_color}{num}. {label}{Color.RESET}")
+                mapping.append(item)
+                num += 1
+
+        # Blank line between the items and the prompt.
+        lines.append("")
+        encoding = _console_encoding()
+        return [line.encode(encoding, "replace") for line in lines], mapping
+
 
 class MenuFolder:
     """
     Represents a folder (submenu) in the menu.
     """
 
-    def __init__(self, name: str, parent: MenuFolder = None):
+    __slots__ = ('name', 'parent', 'children', 'dimension', '__number__',
+                 '_styled_named', '_styled_empty', '_menu')
+    KIND = KIND_FOLDER
+
+    def __init__(self, name: str, parent: MenuFolder = None,
+                 option_color=_DEFAULT, aux_color=_DEFAULT):
         """
         Initialize a MenuFolder.
 
         :param name: The folder's name.
         :param parent: Optional parent folder.
+        :param option_color: The color for the folder's name (defaults to Color.LIGHTMAGENTA_EX).
+        :param aux_color: The color for the "<empty>" marker (defaults to Color.CYAN).
         """
+        option_color = _default_color(option_color, "LIGHTMAGENTA_EX")
+        aux_color = _default_color(aux_color, "CYAN")
         self.name = name
         self.parent = parent
         self.children = []
         self.dimension = 0 if parent is None else parent.dimension + 1
+        # The Menu this folder belongs to, whose caches add_child invalidates;
+        # None until the folder is attached to a menu.
+        self._menu = None if parent is None else parent._menu
+        # Composite number in the expanded menu ("1.2"); set by Menu.__compile__,
+        # None while the folder is empty or not yet displayed.
+        self.__number__ = None
+        self._apply_colors(option_color, aux_color)
+
+    def _apply_colors(self, option_color, aux_color):
+        """
+        Pre-render the folder's labels, so the menu does not rebuild them on every frame.
+        They leave their last color active; the menu resets it at the end of the line.
+
+        :param option_color: The color for the folder's name.
+        :param aux_color: The color for the "<empty>" marker.
+        """
+        active = [None]
+        self._styled_named = _style(f"[{self.name}]", option_color, active)
+        self._styled_empty = self._styled_named + _style(" <empty>", aux_color, active)
 
     def add_child(self, item):
         """
@@ -294,6 +756,17 @@ class MenuFolder:
         :param item: The child item to add.
         """
         self.children.append(item)
+        menu = self._menu
+        if menu is None:
+            return
+        if item.KIND == KIND_FOLDER and item._menu is not menu:
+            # Attach the added subtree, so later changes inside it also reach the menu.
+            folders = [item]
+            while folders:
+                folder = folders.pop()
+                folder._menu = menu
+                folders.extend(child for child in folder.children if child.KIND == KIND_FOLDER)
+        menu.__revision__ += 1
 
 
 class MenuOption:
@@ -301,19 +774,37 @@ class MenuOption:
     Represents an actionable option in the menu.
     """
 
+    __slots__ = ('name', 'action', 'folder', 'dimension', '__number__', '_styled')
+    KIND = KIND_OPTION
+
     def __init__(self, name: str, action: Callable[[], None],
-                 folder: MenuFolder = None):
+                 folder: MenuFolder = None, option_color=_DEFAULT):
         """
         Initialize a MenuOption.
 
         :param name: The option's name.
         :param action: A callable to execute when the option is selected.
         :param folder: Optional parent folder.
+        :param option_color: The color for the option's name (defaults to Color.LIGHTMAGENTA_EX).
         """
+        option_color = _default_color(option_color, "LIGHTMAGENTA_EX")
         self.name = name
         self.action = action
         self.folder = folder
         self.dimension = 0 if folder is None else folder.dimension + 1
+        # Composite number in the expanded menu ("1.2"); set by Menu.__compile__.
+        self.__number__ = None
+        self._apply_colors(option_color, None)
+
+    def _apply_colors(self, option_color, aux_color):
+        """
+        Pre-render the option's label, so the menu does not rebuild it on every frame.
+        The menu resets the color at the end of the line.
+
+        :param option_color: The color for the option's name.
+        :param aux_color: Unused; accepted so all item classes share one signature.
+        """
+        self._styled = f"{option_color}{self.name}"
 
     def invoke(self):
         """
@@ -328,5 +819,23 @@ class MenuSeparator:
     Separators are not selectable and are displayed as a line.
     """
 
-    def __init__(self):
-        pass
\ No newline at end of file
+    __slots__ = ('_styled',)
+    KIND = KIND_SEPARATOR
+
+    def __init__(self, aux_color=_DEFAULT):
+        """
+        Initialize a MenuSeparator.
+
+        :param aux_color: The color for the separator line (defaults to Color.CYAN).
+        """
+        self._apply_colors(None, _default_color(aux_color, "CYAN"))
+
+    def _apply_colors(self, option_color, aux_color):
+        """
+        Pre-render the separator line, so the menu does not rebuild it on every frame.
+        The menu resets the color at the end of the line.
+
+        :param option_color: Unused; accepted so all item classes share one signature.
+        :param aux_color: The color for the separator line.
+        """
+        self._styled = f"{aux_color}- - -"